@@ -6,7 +6,10 @@ from models import *
 import schemas
 from typing import Optional
 from datetime import datetime, timezone
-from sqlalchemy import func
+from sqlalchemy import func, or_
+
+SEARCH_MIN_LENGTH = 3
+SEARCH_MAX_LIMIT = 200
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -92,6 +95,33 @@ def create_dispatch(dispatch: schemas.DispatchCreate):
         return new_dispatch
 
 
+def _apply_dispatch_filters(
+    query,
+    status: Optional[schemas.DispatchStatus] = None,
+    delivery_person_id: Optional[int] = None,
+    date: Optional[str] = None,
+):
+    """Apply the status, delivery person and date filters shared by dispatch queries.
+
+    Raises:
+        HTTPException: 400 if the date cannot be parsed.
+    """
+    if status is not None:
+        query = query.filter(Dispatch.status == status)
+
+    if delivery_person_id is not None:
+        query = query.filter(Dispatch.delivery_person_id == delivery_person_id)
+
+    if date is not None:
+        try:
+            actual_date = datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Error parsing date: {e}")
+        query = query.filter(func.date(Dispatch.create_time) == actual_date)
+
+    return query
+
+
 def filter_dispatches(
     skip: Optional[int] = None,
     limit: Optional[int] = None,
@@ -121,18 +151,7 @@ def filter_dispatches(
         if area is not None:
             query = query.filter(Dispatch.area == area)
 
-        if status is not None:
-            query = query.filter(Dispatch.status == status)
-
-        if delivery_person_id is not None:
-            query = query.filter(Dispatch.delivery_person_id == delivery_person_id)
-
-        if date is not None:
-            try:
-                actual_date = datetime.strptime(date, "%Y-%m-%d").date()
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=f"Error parsing date: {e}")
-            query = query.filter(func.date(Dispatch.create_time) == actual_date)
+        query = _apply_dispatch_filters(query, status, delivery_person_id, date)
 
         if skip is not None:
             query = query.offset(skip)
@@ -143,6 +162,76 @@ def filter_dispatches(
         return query.all()
 
 
+def search_dispatches(
+    q: str,
+    limit: int = 50,
+    after_id: Optional[int] = None,
+    status: Optional[schemas.DispatchStatus] = None,
+    delivery_person_id: Optional[int] = None,
+    date: Optional[str] = None,
+):
+    """Search dispatches by partial, case-insensitive match on area, recipient name or notes.
+
+    On Postgres the ILIKE predicates can be served by the trigram GIN indexes
+    on these columns, depending on the plan Postgres picks. Trigrams need at
+    least 3 characters to use the index, so shorter search text is rejected.
+    Results are ordered by ID and paginated by keyset: pass the returned
+    ``next_after_id`` as ``after_id`` to fetch the following page.
+
+    Args:
+        q: Text to search for.
+        limit: Maximum number of records to return (at most 200).
+        after_id: Only return dispatches with an ID greater than this.
+        status: Filter by dispatch status.
+        delivery_person_id: Filter by delivery person ID.
+        date: Filter by dispatch creation date (Y-m-d).
+
+    Raises:
+        HTTPException: 400 if the search text is shorter than 3 characters, the limit is not between 1 and 200, after_id is not positive, or the date cannot be parsed.
+    """
+    q = q.strip()
+    if len(q) < SEARCH_MIN_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Search text must be at least {SEARCH_MIN_LENGTH} characters",
+        )
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Limit must be between 1 and {SEARCH_MAX_LIMIT}",
+        )
+    if after_id is not None and after_id < 1:
+        raise HTTPException(status_code=400, detail="after_id must be positive")
+
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+
+    with session_scope() as db:
+        query = db.query(Dispatch).filter(
+            or_(
+                Dispatch.area.ilike(pattern, escape="\\"),
+                Dispatch.recipient_name.ilike(pattern, escape="\\"),
+                Dispatch.notes.ilike(pattern, escape="\\"),
+            )
+        )
+        query = _apply_dispatch_filters(query, status, delivery_person_id, date)
+
+        if after_id is not None:
+            query = query.filter(Dispatch.id > after_id)
+
+        dispatches = query.order_by(Dispatch.id).limit(limit + 1).all()
+
+        next_after_id = None
+        if len(dispatches) > limit:
+            dispatches = dispatches[:limit]
+            next_after_id = dispatches[-1].id
+
+        return schemas.DispatchSearchResponse.model_validate(
+            {"dispatches": dispatches, "next_after_id": next_after_id},
+            from_attributes=True,
+        )
+
+
 def accept_dispatch(dispatch_id: int, user_email: str):
     """Accept a dispatch and assign it to a user.
 
@@ -7,6 +7,9 @@ from sqlalchemy import (
     DateTime,
     func,
     ForeignKey,
+    Index,
+    DDL,
+    event,
 )
 from sqlalchemy.orm import relationship
 from database import Base
@@ -63,6 +66,29 @@ class Dispatch(Base):
     """
 
     __tablename__ = "dispatches"
+    # Trigram GIN indexes back the partial-match search on these columns.
+    # They are only created on Postgres; elsewhere they would be plain B-tree
+    # indexes that cannot serve a leading-wildcard ILIKE.
+    __table_args__ = (
+        Index(
+            "ix_dispatches_area_trgm",
+            "area",
+            postgresql_using="gin",
+            postgresql_ops={"area": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_dispatches_recipient_name_trgm",
+            "recipient_name",
+            postgresql_using="gin",
+            postgresql_ops={"recipient_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_dispatches_notes_trgm",
+            "notes",
+            postgresql_using="gin",
+            postgresql_ops={"notes": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     area = Column(String, index=True)
@@ -76,3 +102,12 @@ class Dispatch(Base):
     recipient_name = Column(String, nullable=True)
     delivery_person_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     delivery_person = relationship("User", back_populates="dispatches")
+
+
+# The trigram operator classes used above live in the pg_trgm extension,
+# which must exist before the indexes are created.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -28,6 +28,19 @@ def filter_dispatches(
     )
 
 
+@router.get("/search", response_model=schemas.DispatchSearchResponse)
+def search_dispatches(
+    q: str,
+    limit: int = 50,
+    after_id: Optional[int] = None,
+    status: Optional[schemas.DispatchStatus] = None,
+    delivery_person_id: Optional[int] = None,
+    date: Optional[str] = None,
+    dependency: str = Depends(auth_handler.JWTBearer()),
+):
+    return crud.search_dispatches(q, limit, after_id, status, delivery_person_id, date)
+
+
 @router.get("/{dispatch_id}", response_model=list[schemas.DispatchResponse])
 def get_dispatch(dispatch_id: int, dependency: str = Depends(auth_handler.JWTBearer())):
     return crud.filter_dispatches(dispatch_id=dispatch_id)
@@ -41,6 +41,16 @@ class DispatchResponse(BaseModel):
     create_time: datetime
 
 
+class DispatchSearchResult(DispatchResponse):
+    recipient_name: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class DispatchSearchResponse(BaseModel):
+    dispatches: list[DispatchSearchResult]
+    next_after_id: Optional[int] = None
+
+
 class UserBase(BaseModel):
     username: str
     email: str